@@ -8,6 +8,40 @@ import shutil
 from datetime import datetime
 import sys
 
+try:
+    # zlib-ng is a faster drop-in replacement for zlib's DEFLATE
+    from zlib_ng import zlib_ng
+    ZLIB_NG_AVAILABLE = True
+except ImportError:
+    ZLIB_NG_AVAILABLE = False
+
+def _zip_compression():
+    """Pick the fastest available compression as (method, level)."""
+    if ZLIB_NG_AVAILABLE:
+        zipfile.zlib = zlib_ng
+        # For source code level 3 is barely larger than 6 at a fraction of the CPU
+        return zipfile.ZIP_DEFLATED, 3
+    try:
+        import lzma
+        return zipfile.ZIP_LZMA, 6
+    except ImportError:
+        return zipfile.ZIP_DEFLATED, 3
+
+def _scan_tree(path):
+    """Yield (path, DirEntry) for everything under path in a single scandir pass.
+
+    __pycache__ directories are yielded but not descended into, so callers
+    can remove them wholesale.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                yield entry.path, entry
+                if entry.is_dir(follow_symlinks=False) and entry.name != '__pycache__':
+                    yield from _scan_tree(entry.path)
+    except OSError:
+        pass
+
 def create_distribution_zip():
     """Create a distribution ZIP with only source code and documentation."""
     
@@ -39,25 +73,23 @@ def create_distribution_zip():
     
     total_files = 0
     
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    compression, compresslevel = _zip_compression()
+    
+    with zipfile.ZipFile(zip_filename, 'w', compression=compression, compresslevel=compresslevel) as zipf:
         for item in include_files:
-            if os.path.exists(item):
-                if os.path.isfile(item):
-                    zipf.write(item)
+            item = item.rstrip('/')
+            if os.path.isdir(item):
+                for file_path, entry in _scan_tree(item):
+                    # Skip __pycache__ directories and .pyc files
+                    if not entry.is_file(follow_symlinks=False) or file_path.endswith('.pyc'):
+                        continue
+                    zipf.write(file_path)
                     total_files += 1
-                    print(f"✅ Added file: {item}")
-                elif os.path.isdir(item):
-                    for root, dirs, files in os.walk(item):
-                        # Skip __pycache__ directories
-                        dirs[:] = [d for d in dirs if d != '__pycache__']
-                        
-                        for file in files:
-                            # Skip .pyc files
-                            if not file.endswith('.pyc'):
-                                file_path = os.path.join(root, file)
-                                zipf.write(file_path)
-                                total_files += 1
-                                print(f"✅ Added: {file_path}")
+                    print(f"✅ Added: {file_path}")
+            elif os.path.isfile(item):
+                zipf.write(item)
+                total_files += 1
+                print(f"✅ Added file: {item}")
             else:
                 print(f"⚠️  Not found: {item}")
     
@@ -91,54 +123,52 @@ def cleanup_project():
         except Exception as e:
             print(f"❌ Error removing venv: {e}")
     
-    # Remove __pycache__ directories
-    for root, dirs, files in os.walk('.'):
-        if '__pycache__' in dirs:
-            pycache_path = os.path.join(root, '__pycache__')
+    # Remove __pycache__ directories, .pyc files and large logs in one pass,
+    # tallying the size of whatever is kept as we go
+    logs_dir = os.path.join('.', 'logs')
+    total_size = 0
+    for path, entry in _scan_tree('.'):
+        if entry.name == '__pycache__' and entry.is_dir(follow_symlinks=False):
             try:
-                shutil.rmtree(pycache_path)
-                print(f"✅ Removed: {pycache_path}")
+                shutil.rmtree(path)
+                print(f"✅ Removed: {path}")
             except Exception as e:
-                print(f"❌ Error removing {pycache_path}: {e}")
-    
-    # Remove .pyc files
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.pyc'):
-                file_path = os.path.join(root, file)
-                try:
-                    os.remove(file_path)
-                    print(f"✅ Removed: {file_path}")
-                except Exception as e:
-                    print(f"❌ Error removing {file_path}: {e}")
-    
-    # Optional: Clear large log files but keep directory structure
-    if os.path.exists('logs'):
-        for file in os.listdir('logs'):
-            if file.endswith('.log'):
-                file_path = os.path.join('logs', file)
+                print(f"❌ Error removing {path}: {e}")
+            continue
+        
+        if not entry.is_file(follow_symlinks=False):
+            continue
+        
+        if entry.name.endswith('.pyc'):
+            try:
+                os.remove(path)
+                print(f"✅ Removed: {path}")
+                continue
+            except Exception as e:
+                print(f"❌ Error removing {path}: {e}")
+        
+        try:
+            file_size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        
+        # Optional: Clear large log files but keep directory structure
+        if os.path.dirname(path) == logs_dir and entry.name.endswith('.log'):
+            file_size_mb = file_size / (1024 * 1024)
+            if file_size_mb > 1:  # Remove logs larger than 1MB
                 try:
-                    file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-                    if file_size > 1:  # Remove logs larger than 1MB
-                        os.remove(file_path)
-                        print(f"✅ Removed large log: {file} ({file_size:.2f} MB)")
+                    os.remove(path)
+                    print(f"✅ Removed large log: {entry.name} ({file_size_mb:.2f} MB)")
+                    continue
                 except Exception as e:
-                    print(f"❌ Error with log {file}: {e}")
+                    print(f"❌ Error with log {entry.name}: {e}")
+        
+        total_size += file_size
     
     print("=" * 40)
     print("🎉 Cleanup completed!")
     
     # Show final directory size
-    total_size = 0
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if os.path.exists(file_path):
-                try:
-                    total_size += os.path.getsize(file_path)
-                except:
-                    pass
-    
     final_size_mb = total_size / (1024 * 1024)
     print(f"📊 Final project size: {final_size_mb:.2f} MB")
 
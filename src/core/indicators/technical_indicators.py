@@ -18,8 +18,8 @@ class TechnicalIndicators:
     """Technical indicators calculation class"""
     
     def __init__(self, data: pd.DataFrame):
-        """Initialize with stock data"""
-        self.data = data.copy()
+        """Initialize with stock data (read-only; no method modifies it)"""
+        self.data = data
         
     def rsi(self, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index"""
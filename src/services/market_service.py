@@ -4,8 +4,14 @@ Market service for coordinating stock analysis
 
 import sys
 import os
+import hashlib
+import pickle
 import pandas as pd
-from typing import List, Dict, Any
+from datetime import date
+from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Add parent directories to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -19,12 +25,29 @@ except ImportError:
 from src.data.providers.yahoo_finance_provider import YahooFinanceProvider
 from src.core.strategies.base_strategy import BaseStrategy
 
+# Upper bound on simultaneous per-symbol requests to the data provider
+MAX_CONCURRENT_FETCHES = 10
+
+# Fetches currently in progress, so concurrent callers asking for the same
+# symbol wait on one request instead of issuing their own
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+# How long downloaded daily price history is reused before refetching
+PRICE_CACHE_TTL = 300  # seconds
+
+# Per-symbol analysis results are kept on disk for the trading day; keys include
+# the date, so entries from a previous day are never read
+ANALYSIS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sharemarket', 'symbols')
+ANALYSIS_CACHE_TTL = {'IntradayStrategy': 300, 'SwingTradingStrategy': 3600}  # seconds
+
 class MarketService:
     """Service for coordinating market analysis and stock recommendations"""
     
     def __init__(self):
         """Initialize market service"""
         self.data_provider = YahooFinanceProvider()
+        self._price_cache: Dict[str, tuple] = {}  # symbol -> (fetched_at, DataFrame)
         
     def analyze_stocks(self, symbols: List[str], strategy: BaseStrategy) -> List[Dict]:
         """
@@ -39,12 +62,17 @@ class MarketService:
         """
         recommendations = []
         
+        # Network fetches overlap; analysis below still runs in symbol order
+        fetched = self._fetch_individual(symbols, strategy.timeframe)
+        
         for symbol in symbols:
             try:
                 print(f"📊 Analyzing {symbol.replace('.NS', '')}...")
                 
                 # Get stock data
-                data = self.data_provider.get_stock_data(symbol, strategy.timeframe)
+                data = fetched[symbol]
+                if isinstance(data, Exception):
+                    raise data
                 
                 if data is None or data.empty:
                     logger.warning(f"No data available for {symbol}")
@@ -75,25 +103,114 @@ class MarketService:
     def analyze_stocks_bulk(self, symbols: List[str], strategy) -> List[Dict[str, Any]]:
         """
         Analyze multiple stocks using bulk data fetching for better performance.
+        
+        Symbols analyzed earlier today with the same strategy are served from the
+        on-disk analysis cache; only the rest are downloaded and analyzed.
         """
-        recommendations = []
+        symbols = list(dict.fromkeys(symbols))
+        results = {symbol: self._load_cached_analysis(symbol, strategy) for symbol in symbols}
+        missing = [symbol for symbol, rec in results.items() if rec is None]
         
-        # Get bulk data for all symbols
-        print(f"🔍 Fetching data for {len(symbols)} stocks using bulk processing...")
-        bulk_data = self._fetch_bulk_data(symbols)
+        if missing:
+            self._prune_analysis_cache()
+            # Get bulk data for all symbols
+            print(f"🔍 Fetching data for {len(missing)} stocks using bulk processing...")
+            bulk_data = self.prefetch(missing)
+            
+            print(f"✅ Retrieved data for {len(bulk_data)} stocks. Analyzing...")
+            
+            for symbol, rec in self._analyze_items(bulk_data, strategy):
+                results[symbol] = rec
+                self._save_cached_analysis(symbol, strategy, rec)
         
-        print(f"✅ Retrieved data for {len(bulk_data)} stocks. Analyzing...")
+        return [rec for rec in results.values() if rec]
+    
+    def prefetch(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Return price data for symbols, downloading in one batched pass only those
+        not fetched within the last PRICE_CACHE_TTL seconds.
+        """
+        now = time.time()
+        missing = [
+            symbol for symbol in dict.fromkeys(symbols)
+            if now - self._price_cache.get(symbol, (0, None))[0] > PRICE_CACHE_TTL
+        ]
+        if missing:
+            for symbol, data in self._fetch_bulk_data(missing).items():
+                self._price_cache[symbol] = (now, data)
         
-        for symbol, data in bulk_data.items():
-            if data is not None and not data.empty:
-                try:
-                    recommendation = strategy.analyze(data, symbol)
-                    if recommendation:
-                        recommendations.append(recommendation)
-                except Exception as e:
-                    logger.debug(f"Error analyzing {symbol}: {e}")
+        return {
+            symbol: self._price_cache[symbol][1]
+            for symbol in dict.fromkeys(symbols) if symbol in self._price_cache
+        }
+    
+    def _analyze_items(self, prices: Dict[str, pd.DataFrame], strategy) -> List[tuple]:
+        """Analyze price frames on a thread pool, returning (symbol, recommendation) pairs"""
+        def analyze(item):
+            symbol, data = item
+            if data is None or data.empty:
+                return None
+            try:
+                return strategy.analyze(data, symbol)
+            except Exception as e:
+                logger.debug(f"Error analyzing {symbol}: {e}")
+                return None
         
-        return recommendations
+        if not prices:
+            return []
+        workers = min(MAX_CONCURRENT_FETCHES, len(prices))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [
+                (symbol, rec)
+                for symbol, rec in zip(prices, executor.map(analyze, prices.items())) if rec
+            ]
+    
+    @staticmethod
+    def _analysis_cache_path(symbol: str, strategy) -> str:
+        """Disk location of a symbol's cached analysis for today"""
+        key = hashlib.sha256(
+            f"{symbol}|{date.today().isoformat()}|{type(strategy).__name__}".encode()
+        ).hexdigest()
+        return os.path.join(ANALYSIS_CACHE_DIR, f"{key}.pkl")
+    
+    def _load_cached_analysis(self, symbol: str, strategy) -> Optional[Dict[str, Any]]:
+        """Return today's cached analysis for symbol if still fresh, else None"""
+        cache_path = self._analysis_cache_path(symbol, strategy)
+        ttl = ANALYSIS_CACHE_TTL.get(type(strategy).__name__, PRICE_CACHE_TTL)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > ttl:
+                return None
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def _save_cached_analysis(self, symbol: str, strategy, rec: Dict[str, Any]) -> None:
+        """Store a symbol's analysis; the cache is best-effort, so failures are only logged"""
+        cache_path = self._analysis_cache_path(symbol, strategy)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(rec, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug(f"Could not cache analysis for {symbol}: {e}")
+    
+    @staticmethod
+    def _prune_analysis_cache() -> None:
+        """Delete cached analyses saved before today; their keys can never match again"""
+        cutoff = time.mktime(date.today().timetuple())
+        try:
+            entries = list(os.scandir(ANALYSIS_CACHE_DIR))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.name.endswith(('.pkl', '.tmp')) and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError as e:
+                logger.debug(f"Could not prune cached analysis {entry.name}: {e}")
     
     def _fetch_bulk_data(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
         """
@@ -140,28 +257,62 @@ class MarketService:
                                 
                 except ImportError:
                     # Fallback to individual calls if yfinance not available
-                    for symbol in batch:
-                        try:
-                            stock_data = self.data_provider.get_stock_data(symbol)
-                            if stock_data is not None and not stock_data.empty:
-                                bulk_data[symbol] = stock_data
-                        except Exception:
-                            continue
+                    bulk_data.update(self._usable(self._fetch_individual(batch)))
                             
             except Exception as e:
                 logger.debug(f"Error fetching batch {batch_progress}: {e}")
                 # Fallback to individual calls for this batch
-                for symbol in batch:
-                    try:
-                        stock_data = self.data_provider.get_stock_data(symbol)
-                        if stock_data is not None and not stock_data.empty:
-                            bulk_data[symbol] = stock_data
-                    except Exception:
-                        continue
+                bulk_data.update(self._usable(self._fetch_individual(batch)))
         
         print("\r" + " " * 50 + "\r", end="")  # Clear the line
         return bulk_data
 
+    def _fetch_individual(self, symbols: List[str], *args, **kwargs) -> Dict[str, Any]:
+        """
+        Fetch symbols one request each, with up to MAX_CONCURRENT_FETCHES in flight.
+        
+        Returns a symbol -> DataFrame mapping; a failed fetch maps to its exception.
+        Duplicate symbols, and symbols another caller is already fetching, share
+        a single request.
+        
+        The data provider is called from worker threads, so it must be safe to
+        use concurrently.
+        """
+        def fetch(symbol):
+            key = (symbol, args, tuple(sorted(kwargs.items())))
+            with _inflight_lock:
+                pending = _inflight.get(key)
+                if pending is None:
+                    _inflight[key] = future = Future()
+            if pending is not None:
+                return pending.result()
+            
+            result = None
+            try:
+                result = self.data_provider.get_stock_data(symbol, *args, **kwargs)
+            except Exception as e:
+                result = e
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(key, None)
+                future.set_result(result)
+            return result
+        
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+        workers = min(MAX_CONCURRENT_FETCHES, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique, executor.map(fetch, unique)))
+    
+    @staticmethod
+    def _usable(fetched: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """Drop failed or empty fetches from a _fetch_individual result."""
+        return {
+            symbol: data for symbol, data in fetched.items()
+            if isinstance(data, pd.DataFrame) and not data.empty
+        }
+
     def display_market_overview(self):
         """Display market overview"""
         print("\n🌍 INDIAN MARKET OVERVIEW")
@@ -4,7 +4,7 @@ Stock Scanner service for finding stocks with specific technical patterns
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator
 
 # Handle imports with fallback
 try:
@@ -159,8 +159,10 @@ class StockScanner:
     
     def find_death_cross(self, lookback_days: int = 5) -> List[Dict]:
         """Find stocks with death cross (50 SMA crosses below 200 SMA)"""
-        results = []
-        
+        return sorted(self.iter_death_cross(lookback_days), key=lambda x: x['change_percent'])
+    
+    def iter_death_cross(self, lookback_days: int = 5) -> Iterator[Dict]:
+        """Yield death cross matches as each stock is scanned, in universe order"""
         print(f"Scanning {len(self.stock_universe)} stocks for Death Cross...")
         
         for i, symbol in enumerate(self.stock_universe):
@@ -185,7 +187,7 @@ class StockScanner:
                 if (sma_50.iloc[-1] < sma_200.iloc[-1] and 
                     sma_50.iloc[-lookback_days] >= sma_200.iloc[-lookback_days]):
                     
-                    results.append({
+                    yield {
                         'symbol': symbol,
                         'current_price': current_price,
                         'signal': 'BEARISH',
@@ -193,13 +195,11 @@ class StockScanner:
                         'details': f'50SMA: ₹{sma_50.iloc[-1]:.2f} crossed below 200SMA: ₹{sma_200.iloc[-1]:.2f}',
                         'change_percent': self._calculate_change_percent(data),
                         'volume_info': self._analyze_volume(data)
-                    })
+                    }
                     
             except Exception as e:
                 logger.debug(f"Error scanning {symbol} for death cross: {e}")
                 continue
-        
-        return sorted(results, key=lambda x: x['change_percent'])
     
     def find_volume_breakout(self, volume_threshold: float = 2.0) -> List[Dict]:
         """Find stocks with high volume breakout"""
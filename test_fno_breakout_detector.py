@@ -0,0 +1,81 @@
+"""
+Tests for the F&O breakout detector
+"""
+
+import copy
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from fno_breakout_detector import (
+    BreakoutSignal,
+    BreakoutType,
+    FNOBreakoutDetector,
+    _ema,
+    _rolling_mean_std,
+)
+
+
+def _sample_signal():
+    return BreakoutSignal('RELIANCE', BreakoutType.MACD_BULLISH, 2450.5,
+                          pd.Timestamp('2026-10-15 15:30'), 72.5, (1.2, 0.8, 0.4, 125000.0))
+
+
+def test_breakout_signal_pickle_roundtrip():
+    signal = _sample_signal()
+    restored = pickle.loads(pickle.dumps(signal))
+    assert restored == signal
+    assert restored.details == signal.details
+
+
+def test_breakout_signal_copy():
+    signal = _sample_signal()
+    assert copy.copy(signal) == signal
+    assert copy.deepcopy(signal) == signal
+
+
+def _random_frames(n_symbols=30, seed=1):
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for k in range(n_symbols):
+        n = int(rng.integers(20, 120))
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, n)))
+        frames[f'SYM{k}'] = pd.DataFrame(
+            {'close': close, 'volume': rng.integers(100_000, 1_000_000, n)},
+            index=pd.date_range('2026-01-01', periods=n),
+        )
+    return frames
+
+
+def test_ema_matches_pandas():
+    close = _random_frames(1)['SYM0']['close'].to_numpy(np.float64)
+    expected = pd.Series(close).ewm(alpha=0.2, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(_ema(close, 0.2), expected)
+    assert _ema(np.empty(0), 0.2).shape == (0,)
+
+
+def test_rolling_mean_std_matches_pandas():
+    close = pd.Series(_random_frames(1)['SYM0']['close'].to_numpy(np.float64))
+    mean, std = _rolling_mean_std(close.to_numpy(), 20)
+    np.testing.assert_allclose(mean, close.rolling(20).mean().to_numpy())
+    np.testing.assert_allclose(std, close.rolling(20).std().to_numpy())
+
+
+def test_calculate_macd_empty_frame():
+    result = FNOBreakoutDetector().calculate_macd(pd.DataFrame({'close': []}))
+    assert all(len(values) == 0 for values in result.values())
+
+
+def test_scan_batch_matches_scan_all_patterns():
+    detector = FNOBreakoutDetector()
+    frames = _random_frames()
+    batched = detector.scan_batch(frames)
+    per_symbol = [s for symbol, df in frames.items() for s in detector.scan_all_patterns(df, symbol)]
+    
+    assert [(s.symbol, s.breakout_type) for s in batched] == \
+        [(s.symbol, s.breakout_type) for s in per_symbol]
+    for got, want in zip(batched, per_symbol):
+        # The batched kernel stacks closes as float32
+        assert abs(got.strength - want.strength) < 1e-3
+        np.testing.assert_allclose(got.details_raw, want.details_raw, rtol=1e-4)
@@ -0,0 +1,28 @@
+"""
+Tests for main.py helpers
+"""
+
+from main import normalize_symbols, top_signals
+
+
+def test_normalize_symbols():
+    assert normalize_symbols(" reliance, TCS.NS ,, infy ") == ['RELIANCE.NS', 'TCS.NS', 'INFY.NS']
+    assert normalize_symbols(" , ") == []
+
+
+def test_top_signals():
+    recommendations = [
+        {'symbol': 'A', 'action': 'BUY', 'confidence': 60.0},
+        {'symbol': 'B', 'action': 'SELL', 'confidence': 90.0},
+        {'symbol': 'C', 'action': 'BUY', 'confidence': 80.0},
+        {'symbol': 'D', 'action': 'HOLD', 'confidence': 70.0},
+        {'symbol': 'E', 'action': 'BUY', 'confidence': 80.0},
+    ]
+    count, top = top_signals(recommendations, 'BUY', limit=2)
+    assert count == 3
+    # Highest confidence first; ties keep input order
+    assert [r['symbol'] for r in top] == ['C', 'E']
+    
+    count, top = top_signals(recommendations, 'SELL')
+    assert (count, [r['symbol'] for r in top]) == (1, ['B'])
+    assert top_signals([], 'BUY') == (0, [])